@@ -0,0 +1,31 @@
+"""
+Django settings used when running the test suite.
+
+Usage: python manage.py test --settings=app.settings_test
+"""
+
+import os
+
+from app.settings import *  # noqa: F401,F403
+from app.settings import DATABASES
+
+
+# CI tests against Postgres like production. For quicker local runs set
+# TEST_SQLITE=1 to use an in-memory SQLite database instead.
+if os.environ.get("TEST_SQLITE") == "1":
+    default_db = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+else:
+    default_db = DATABASES["default"]
+
+# Build the test database straight from the models instead of replaying
+# the migration history. CI checks the migrations with makemigrations.
+# A new dict is built so the one shared with app.settings is not mutated.
+DATABASES = {
+    **DATABASES,
+    "default": {**default_db, "TEST": {"MIGRATE": False}},
+}
+
+# Key stretching is pointless in tests, use the cheapest hasher available.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
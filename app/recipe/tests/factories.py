@@ -0,0 +1,100 @@
+"""Model factories for the recipe API tests."""
+
+from decimal import Decimal
+
+import factory
+from django.contrib.auth import get_user_model
+
+from core.models import Recipe, Tag, Ingredient
+
+
+def add_related(recipe, relation, names):
+    """Link tags/ingredients to a recipe by name using bulk inserts.
+
+    Existing objects owned by the recipe's user are reused and missing ones
+    are created, then every link is written to the through table at once.
+    This costs three queries however many names are given, where
+    ``recipe.tags.add()`` would insert one row at a time.
+    """
+    field = Recipe._meta.get_field(relation)
+    model = field.related_model
+    names = list(dict.fromkeys(names))
+
+    objs = {
+        obj.name: obj
+        for obj in model.objects.filter(user=recipe.user, name__in=names)
+    }
+    objs.update(
+        (obj.name, obj)
+        for obj in model.objects.bulk_create(
+            [model(user=recipe.user, name=n) for n in names if n not in objs]
+        )
+    )
+
+    through = field.remote_field.through
+    through.objects.bulk_create(
+        [
+            through(**{"recipe": recipe, model._meta.model_name: objs[n]})
+            for n in names
+        ]
+    )
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """Factory for users"""
+
+    class Meta:
+        model = get_user_model()
+
+    email = factory.Sequence(lambda n: f"user{n}@example.com")
+    name = factory.Sequence(lambda n: f"User {n}")
+    # Tests authenticate with force_authenticate, so skip hashing by default.
+    # Pass password="..." to get a usable (hashed) one.
+    password = factory.django.Password(None)
+
+
+class TagFactory(factory.django.DjangoModelFactory):
+    """Factory for tags"""
+
+    class Meta:
+        model = Tag
+        django_get_or_create = ("name", "user")
+
+    name = factory.Sequence(lambda n: f"tag{n}")
+    user = factory.SubFactory(UserFactory)
+
+
+class IngredientFactory(factory.django.DjangoModelFactory):
+    """Factory for ingredients"""
+
+    class Meta:
+        model = Ingredient
+        django_get_or_create = ("name", "user")
+
+    name = factory.Sequence(lambda n: f"ingredient{n}")
+    user = factory.SubFactory(UserFactory)
+
+
+class RecipeFactory(factory.django.DjangoModelFactory):
+    """Factory for recipes"""
+
+    class Meta:
+        model = Recipe
+        skip_postgeneration_save = True
+
+    user = factory.SubFactory(UserFactory)
+    title = factory.Sequence(lambda n: f"Recipe {n}")
+    description = factory.Sequence(lambda n: f"Description for recipe {n}")
+    time_minutes = 22
+    price = Decimal("5.25")
+    link = "http://example.com/recipe.pdf"
+
+    @factory.post_generation
+    def tags(self, create, extracted, **kwargs):
+        if create and extracted:
+            add_related(self, "tags", extracted)
+
+    @factory.post_generation
+    def ingredients(self, create, extracted, **kwargs):
+        if create and extracted:
+            add_related(self, "ingredients", extracted)
@@ -1,6 +1,5 @@
 """Test for the ingredients API."""
 
-from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.test import TestCase
 
@@ -10,13 +9,10 @@ from rest_framework.test import APIClient
 from core.models import Ingredient
 
 from recipe.serializers import IngredientSerializer
+from recipe.tests.factories import UserFactory
 
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
-def create_user(email="user@example.com", password="testpass123"):
-    """Create and return a new user"""
-    return get_user_model().objects.create_user(email=email, password=password)
-
 def detail_url(ingredient_id):
     """Create and return an ingredient detail URL"""
     return reverse('recipe:ingredient-detail', args=[ingredient_id])
@@ -39,7 +35,7 @@ class PrivateIngredientsAPITests(TestCase):
 
     def setUp(self):
         self.client = APIClient()
-        self.user= create_user()
+        self.user= UserFactory(email='user@example.com')
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredients(self):
@@ -50,14 +46,14 @@ class PrivateIngredientsAPITests(TestCase):
 
         res = self.client.get(INGREDIENTS_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        ingredients = Ingredient.objects.all().order_by('-name')
+        ingredients = Ingredient.objects.order_by('-name')
 
         serializer = IngredientSerializer(ingredients, many=True)
         self.assertEqual(res.data, serializer.data)
 
     def test_ingredients_limited_to_user(self):
         """Test list of ingredients is limited to authenticated user."""
-        user2 = create_user(email='user2@example.com')
+        user2 = UserFactory(email='user2@example.com')
         Ingredient.objects.create(user=user2, name='Salt')
         ingredient = Ingredient.objects.create(user=self.user, name='Pepper')
 
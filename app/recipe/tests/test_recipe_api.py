@@ -1,20 +1,28 @@
 """Test recipe APIs."""  # File docstring describing the purpose of the file
 
-import tempfile
 import os
 
+from io import BytesIO
+
 from PIL import Image
 
 from decimal import Decimal  # Import Decimal for precise price values
 
-from django.contrib.auth import (
-    get_user_model,
-)  # Import function to get the custom user model
-from django.test import TestCase  # Import Django's test case class
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+)  # Import Django's test case classes
 from django.urls import reverse  # Import reverse to build URLs from route names
 
 from rest_framework import status  # Import HTTP status codes
-from rest_framework.test import APIClient  # Import DRF's APIClient for API testing
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)  # Import DRF's APIClient and request factory for API testing
+
+from unittest_parametrize import ParametrizedTestCase, parametrize, param
 
 from core.models import (
     Recipe,
@@ -23,53 +31,47 @@ from core.models import (
 )  # Import Recipe, Tag, Ingredient models from core app
 
 from recipe.serializers import (
-    RecipeSerializer,
     RecipeDetailSerializer,
-)  # Import serializers for recipes
+)  # Import the recipe detail serializer
+from recipe.views import RecipeViewSet
+from recipe.tests.factories import (
+    UserFactory,
+    RecipeFactory,
+    TagFactory,
+    IngredientFactory,
+)  # Import model factories for test data
 
 RECIPES_URL = reverse(
     "recipe:recipe-list"
 )  # Build the URL for the recipe list endpoint
+RECIPE_LIST_VIEW = RecipeViewSet.as_view(
+    {"get": "list"}
+)  # Recipe list view, called directly to skip URL routing and middleware
+
+
+# Reverse the detail URLs once with a placeholder id, so the helpers
+# below only need a str.format() instead of a resolver walk per call.
+DETAIL_URL_TEMPLATE = reverse("recipe:recipe-detail", args=[0]).replace(
+    "/0/", "/{}/"
+)
+IMAGE_UPLOAD_URL_TEMPLATE = reverse(
+    "recipe:recipe-upload-image", args=[0]
+).replace("/0/", "/{}/")
 
 
 def detail_url(recipe_id):
     """Create and return a recipe detail URL."""  # Docstring for the helper function
-    return reverse(
-        "recipe:recipe-detail", args=[recipe_id]
+    return DETAIL_URL_TEMPLATE.format(
+        recipe_id
     )  # Build the detail URL for a specific recipe
 
 
 def image_upload_url(recipe_id):
     """Create and return an image upload URL."""
-    return reverse("recipe:recipe-upload-image", args=[recipe_id])
-
-
-def create_recipe(user, **params):
-    """Helper function that creates and returns a new recipe"""  # Docstring for the helper function
-
-    defaults = {
-        "title": "Sample recipe title",  # Default title for the recipe
-        "time_minutes": 22,  # Default time in minutes
-        "price": Decimal("5.25"),  # Default price using Decimal
-        "description": "Sample description",  # Default description
-        "link": "http://example.com/recipe.pdf",  # Default link
-    }
-    defaults.update(params)  # Update defaults with any provided parameters
-
-    recipe = Recipe.objects.create(
-        user=user, **defaults
-    )  # Create a new Recipe object with the user and defaults
-    return recipe  # Return the created recipe
-
-
-def create_user(**params):
-    """Create and return a new user"""  # Docstring for the helper function
-    return get_user_model().objects.create_user(
-        **params
-    )  # Create and return a new user using the custom user model
+    return IMAGE_UPLOAD_URL_TEMPLATE.format(recipe_id)
 
 
-class PublicRecipeAPITests(TestCase):
+class PublicRecipeAPITests(SimpleTestCase):
     """Test unauthenticated API requests."""  # Docstring for the test class
 
     def setUp(self):
@@ -84,66 +86,74 @@ class PublicRecipeAPITests(TestCase):
         )  # Assert that the response status is 401
 
 
-class PrivateRecipeAPITests(TestCase):
+class PrivateRecipeAPITests(ParametrizedTestCase, TestCase):
     """Test authenticated API requests."""  # Docstring for the test class
 
+    factory = APIRequestFactory()  # Request factory for direct view calls
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(
+            email="user@example.com"
+        )  # Create the test user once for the whole class
+
     def setUp(self):
         self.client = APIClient()  # Set up the API client
-        self.user = create_user(
-            email="user@example.com", password="testpass123"
-        )  # Create a test user
-
         self.client.force_authenticate(
             self.user
         )  # Authenticate the client with the test user
 
+    def list_recipes(self, params=None):
+        """List recipes by calling the list view directly."""
+        request = self.factory.get(RECIPES_URL, params)
+        force_authenticate(request, user=self.user)
+        return RECIPE_LIST_VIEW(request)
+
     def test_retrieve_recipes(self):
         """Test retrieving user's list of recipes."""  # Docstring for the test
-        create_recipe(user=self.user)  # Create a recipe for the user
-        create_recipe(user=self.user)  # Create another recipe for the user
+        RecipeFactory(user=self.user)  # Create a recipe for the user
+        RecipeFactory(user=self.user)  # Create another recipe for the user
 
-        res = self.client.get(RECIPES_URL)  # Make a GET request to the recipes endpoint
+        with self.assertNumQueries(3):  # recipes + prefetched tags + ingredients
+            res = self.list_recipes()
 
-        recipes = Recipe.objects.all().order_by(
+        recipes = Recipe.objects.order_by(
             "-id"
         )  # Get all recipes ordered by id descending
-        serializer = RecipeSerializer(recipes, many=True)  # Serialize the recipes
 
         self.assertEqual(
             res.status_code, status.HTTP_200_OK
         )  # Assert that the response status is 200
-        self.assertEqual(
-            res.data, serializer.data
-        )  # Assert that the response data matches the serialized data
+        self.assertQuerySetEqual(
+            recipes, [r["id"] for r in res.data], transform=lambda r: r.id
+        )  # Assert that the response lists the same recipes in the same order
 
     def test_recipe_list_limited_to_user(self):
         """Test list of recipes is limited to authenticated user."""  # Docstring for the test
-        other_user = create_user(
-            email="otheruser@exmaple.com", password="testpass321"
+        other_user = UserFactory(
+            email="otheruser@exmaple.com"
         )  # Create another user
 
-        create_recipe(user=other_user)  # Create a recipe for the other user
-        create_recipe(user=self.user)  # Create a recipe for the authenticated user
+        RecipeFactory(user=other_user)  # Create a recipe for the other user
+        RecipeFactory(user=self.user)  # Create a recipe for the authenticated user
 
-        res = self.client.get(RECIPES_URL)  # Make a GET request to the recipes endpoint
+        with self.assertNumQueries(3):
+            res = self.list_recipes()
 
-        recipes = Recipe.objects.filter(
-            user=self.user
+        recipes = Recipe.objects.filter(user=self.user).order_by(
+            "-id"
         )  # Filter recipes by the authenticated user
-        serializer = RecipeSerializer(
-            recipes, many=True
-        )  # Serialize the filtered recipes
         self.assertEqual(
             res.status_code, status.HTTP_200_OK
         )  # Assert that the response status is 200
-        self.assertEqual(
-            res.data, serializer.data
-        )  # Assert that the response data matches the serialized data
+        self.assertQuerySetEqual(
+            recipes, [r["id"] for r in res.data], transform=lambda r: r.id
+        )  # Assert that only the user's recipes are listed
 
     def test_get_recipe_detail(self):
         """Test get recipe detail"""  # Docstring for the test
 
-        recipe = create_recipe(user=self.user)  # Create a recipe for the user
+        recipe = RecipeFactory(user=self.user)  # Create a recipe for the user
 
         url = detail_url(recipe.id)  # Build the detail URL for the recipe
         res = self.client.get(url)  # Make a GET request to the recipe detail endpoint
@@ -187,7 +197,7 @@ class PrivateRecipeAPITests(TestCase):
     def test_partial_update(self):
         """Test partial update of a recipe"""  # Docstring for the test
         original_link = "https://example.com/recipe.pdf"  # Store the original link
-        recipe = create_recipe(
+        recipe = RecipeFactory(
             user=self.user, title="Sample recipe title", link=original_link
         )  # Create a recipe with a specific link
 
@@ -216,7 +226,7 @@ class PrivateRecipeAPITests(TestCase):
     def test_full_update(self):
         """Test full update of recipe."""  # Docstring for the test
 
-        recipe = create_recipe(
+        recipe = RecipeFactory(
             user=self.user,
             title="Sample recipe title",
             link="https://example.com/recipe.pdf",
@@ -250,10 +260,10 @@ class PrivateRecipeAPITests(TestCase):
 
     def test_update_user_returns_error(self):
         """Test changing the recipe user results in an error"""  # Docstring for the test
-        new_user = create_user(
-            email="user2@example.com", password="test123"
+        new_user = UserFactory(
+            email="user2@example.com"
         )  # Create a new user
-        recipe = create_recipe(
+        recipe = RecipeFactory(
             user=self.user
         )  # Create a recipe for the authenticated user
 
@@ -269,7 +279,7 @@ class PrivateRecipeAPITests(TestCase):
     def test_delete_recipe(self):
         """Test deleting a recipe successful."""  # Docstring for the test
 
-        recipe = create_recipe(
+        recipe = RecipeFactory(
             user=self.user
         )  # Create a recipe for the authenticated user
 
@@ -286,10 +296,10 @@ class PrivateRecipeAPITests(TestCase):
     def test_delete_other_user_recipe_error(self):
         """Test deleting a recipe successful."""  # Docstring for the test
 
-        new_user = create_user(
-            email="user2@example.com", password="test123"
+        new_user = UserFactory(
+            email="user2@example.com"
         )  # Create a new user
-        recipe = create_recipe(user=new_user)  # Create a recipe for the new user
+        recipe = RecipeFactory(user=new_user)  # Create a recipe for the new user
 
         url = detail_url(recipe.id)  # Build the detail URL for the recipe
         res = self.client.delete(url)  # Make a DELETE request to delete the recipe
@@ -301,71 +311,85 @@ class PrivateRecipeAPITests(TestCase):
             Recipe.objects.filter(id=recipe.id).exists()
         )  # Assert that the recipe still exists
 
-    def test_create_recipe_with_new_tags(self):
-        """Test creating a recipe with new tags"""  # Docstring for the test
+    @parametrize(
+        "relation,names",
+        [
+            param("tags", ["Thai", "Dinner"], id="tags"),
+            param("ingredients", ["Coriander", "Eggs"], id="ingredients"),
+        ],
+    )
+    def test_create_recipe_with_new_related(self, relation, names):
+        """Test creating a recipe with new tags/ingredients"""
 
         payload = {
-            "title": "Thai Prawn Curry",  # Title for the new recipe
-            "time_minutes": 30,  # Time in minutes
-            "price": Decimal("2.50"),  # Price
-            "tags": [{"name": "Thai"}, {"name": "Dinner"}],  # List of new tags
+            "title": "Thai Prawn Curry",
+            "time_minutes": 30,
+            "price": Decimal("2.50"),
+            relation: [{"name": name} for name in names],
         }
-        res = self.client.post(
-            RECIPES_URL, payload, format="json"
-        )  # Make a POST request to create the recipe with tags
-
-        self.assertEqual(
-            res.status_code, status.HTTP_201_CREATED
-        )  # Assert that the response status is 201
+        res = self.client.post(RECIPES_URL, payload, format="json")
 
-        recipes = Recipe.objects.filter(
-            user=self.user
-        )  # Get the created recipe for the user
-        self.assertEqual(recipes.count(), 1)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipes = list(
+            Recipe.objects.filter(user=self.user).prefetch_related(relation)
+        )
+        self.assertEqual(len(recipes), 1)
         recipe = recipes[0]
-        for tag in payload["tags"]:  # Loop through the tags in the payload
-            exists = recipe.tags.filter(
-                name=tag["name"], user=self.user
-            ).exists()  # Check if the tag exists for the user
-            self.assertTrue(exists)  # Assert that the tag exists
-
-    def test_create_recipe_with_existing_tags(self):
-        """Test creating a recipe with existing tags"""  # Docstring for the test
-
-        tag1 = Tag.objects.create(
-            user=self.user, name="Indian"
-        )  # Create an existing tag for the user
+        related = getattr(recipe, relation)
+        self.assertEqual(len(related.all()), len(names))
+        found = set(
+            related.filter(user=self.user, name__in=names).values_list(
+                "name", flat=True
+            )
+        )
+        self.assertEqual(found, set(names))
+
+    @parametrize(
+        "relation,model_factory,names",
+        [
+            param("tags", TagFactory, ["Indian", "Breakfast"], id="tags"),
+            param(
+                "ingredients",
+                IngredientFactory,
+                ["Lemon", "Fish Sauce"],
+                id="ingredients",
+            ),
+        ],
+    )
+    def test_create_recipe_with_existing_related(
+        self, relation, model_factory, names
+    ):
+        """Test creating a recipe with existing tags/ingredients"""
+
+        existing = model_factory(user=self.user, name=names[0])
         payload = {
-            "title": "Pongal",  # Title for the new recipe
-            "time_minutes": 60,  # Time in minutes
-            "price": Decimal("4.50"),  # Price
-            "tags": [
-                {"name": "Indian"},
-                {"name": "Breakfast"},
-            ],  # List of tags (one existing, one new)
+            "title": "Pongal",
+            "time_minutes": 60,
+            "price": Decimal("4.50"),
+            relation: [{"name": name} for name in names],
         }
-        res = self.client.post(
-            RECIPES_URL, payload, format="json"
-        )  # Make a POST request to create the recipe with tags
-        self.assertEqual(
-            res.status_code, status.HTTP_201_CREATED
-        )  # Assert that the response status is 201
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-
-        recipe = recipes[0]  # Get the created recipe for the user
-        self.assertEqual(recipe.tags.count(), 2)
-        self.assertIn(tag1, recipe.tags.all())
-        for tag in payload["tags"]:  # Loop through the tags in the payload
-            exists = recipe.tags.filter(
-                name=tag["name"], user=self.user
-            ).exists()  # Check if the tag exists for the user
-            self.assertTrue(exists)  # Assert that the tag exists
+        res = self.client.post(RECIPES_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipes = list(
+            Recipe.objects.filter(user=self.user).prefetch_related(relation)
+        )
+        self.assertEqual(len(recipes), 1)
+        recipe = recipes[0]
+        related = getattr(recipe, relation)
+        self.assertEqual(len(related.all()), len(names))
+        self.assertIn(existing, related.all())
+        found = set(
+            related.filter(user=self.user, name__in=names).values_list(
+                "name", flat=True
+            )
+        )
+        self.assertEqual(found, set(names))
 
     def test_create_tag_on_update(self):
         """Test creating new tag when update recipe."""  # Docstring for the test
 
-        recipe = create_recipe(user=self.user)  # Create a recipe for the user
+        recipe = RecipeFactory(user=self.user)  # Create a recipe for the user
         payload = {"tags": [{"name": "Lunch"}]}  # New tag to be added
         url = detail_url(recipe.id)  # Build the detail URL for the recipe
         res = self.client.patch(
@@ -382,67 +406,29 @@ class PrivateRecipeAPITests(TestCase):
             new_tag, recipe.tags.all()
         )  # Assert that the new tag is linked to the recipe
 
-    def test_clear_recipe_tags(self):
-        """Test clear recipe tag"""
-
-        tag = Tag.objects.create(user=self.user, name="Dessert")  # Create a tag
-        recipe = create_recipe(user=self.user)  # Create a recipe
-        recipe.tags.add(tag)  # Add the tag to the recipe
+    @parametrize(
+        "relation,name",
+        [
+            param("tags", "Dessert", id="tags"),
+            param("ingredients", "Garlic", id="ingredients"),
+        ],
+    )
+    def test_clear_recipe_related(self, relation, name):
+        """Test clearing a recipe's tags/ingredients"""
 
-        payload = {"tags": []}  # Payload to clear tags
+        recipe = RecipeFactory(user=self.user, **{relation: [name]})
 
-        url = detail_url(recipe.id)  # Get recipe detail URL
-        res = self.client.patch(url, payload, format="json")  # Send PATCH request
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)  # Check response status
-        recipe.refresh_from_db()  # Refresh recipe from database
-        self.assertEqual(recipe.tags.count(), 0)  # Assert tags are cleared
+        payload = {relation: []}
+        url = detail_url(recipe.id)
+        res = self.client.patch(url, payload, format="json")
 
-    def test_create_recipe_with_new_ingredients(self):
-        """Test creating a recipe with new ingredients"""
-        payload = {
-            "title": "Coriander eggs on toast",
-            "time_minutes": 30,
-            "price": Decimal("5.50"),
-            "ingredients": [{"name": "Coriander"}, {"name": "Eggs"}],
-        }
-        res = self.client.post(RECIPES_URL, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.ingredients.count(), 2)
-        for ingredient in payload["ingredients"]:
-            exists = recipe.ingredients.filter(
-                name=ingredient["name"], user=self.user
-            ).exists()
-            self.assertTrue(exists)
-
-    def test_create_recipe_with_existing_ingredients(self):
-        """Test creating a recipe with existing ingredients"""
-        ingredient = Ingredient.objects.create(user=self.user, name="Lemon")
-        payload = {
-            "title": "Vietnamese Soup",
-            "time_minutes": 25,
-            "price": Decimal("2.50"),
-            "ingredients": [{"name": "Lemon"}, {"name": "Fish Sauce"}],
-        }
-        res = self.client.post(RECIPES_URL, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.ingredients.count(), 2)
-        self.assertIn(ingredient, recipe.ingredients.all())
-        for ingredient in payload["ingredients"]:
-            exists = recipe.ingredients.filter(
-                name=ingredient["name"], user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        recipe.refresh_from_db()
+        self.assertEqual(getattr(recipe, relation).count(), 0)
 
     def test_create_ingredient_on_update(self):
         """Test creating an ingredient when updating a recipe"""
-        recipe = create_recipe(user=self.user)
+        recipe = RecipeFactory(user=self.user)
         payload = {"ingredients": [{"name": "Limes"}]}
         url = detail_url(recipe.id)
         res = self.client.patch(url, payload, format="json")
@@ -453,10 +439,9 @@ class PrivateRecipeAPITests(TestCase):
 
     def test_update_recipe_assign_ingredient(self):
         """Test assigning an existing ingredient when updating a recipe"""
-        ingredient1 = Ingredient.objects.create(user=self.user, name="Pepper")
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient1)
-        ingredient2 = Ingredient.objects.create(user=self.user, name="Chili")
+        ingredient1 = IngredientFactory(user=self.user, name="Pepper")
+        recipe = RecipeFactory(user=self.user, ingredients=["Pepper"])
+        ingredient2 = IngredientFactory(user=self.user, name="Chili")
         payload = {"ingredients": [{"name": "Chili"}]}
         url = detail_url(recipe.id)
         res = self.client.patch(url, payload, format="json")
@@ -464,70 +449,55 @@ class PrivateRecipeAPITests(TestCase):
         self.assertIn(ingredient2, recipe.ingredients.all())
         self.assertNotIn(ingredient1, recipe.ingredients.all())
 
-    def test_clear_recipe_ingredients(self):
-        """Test clearing a recipe's ingredients"""
-        ingredient = Ingredient.objects.create(user=self.user, name="Garlic")
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient)
-        payload = {"ingredients": []}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertNotIn(ingredient, recipe.ingredients.all())
-
-    def test_filter_by_tags(self):
-        """Test filtering recipes by tags."""
-        r1 = create_recipe(user=self.user, title="Thai Vegetable Curry")
-        r2 = create_recipe(user=self.user, title="Aubergine with Tahini")
-        r3 = create_recipe(user=self.user, title="fish and chips")
-        tag1 = Tag.objects.create(user=self.user, name="Vegan")
-        tag2 = Tag.objects.create(user=self.user, name="Vegetarian")
-
-        r1.tags.add(tag1)
-        r2.tags.add(tag2)
-
-        params = {"tags": f"{tag1.id},{tag2.id}"}
-        res = self.client.get(RECIPES_URL, params)
-
-        s1 = RecipeSerializer(r1)
-        s2 = RecipeSerializer(r2)
-        s3 = RecipeSerializer(r3)
-
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
-
-    def test_filter_by_ingredients(self):
-        """Test filtering recipes by ingredients."""
-        r1 = create_recipe(user=self.user, title="Thai Vegetable Curry")
-        r2 = create_recipe(user=self.user, title="Aubergine with Tahini")
-        r3 = create_recipe(user=self.user, title="fish and chips")
-        ingredient1 = Ingredient.objects.create(user=self.user, name="Feta cheese")
-        ingredient2 = Ingredient.objects.create(user=self.user, name="Chicken")
-
-        r1.ingredients.add(ingredient1)
-        r2.ingredients.add(ingredient2)
-
-        params = {"ingredients": f"{ingredient1.id},{ingredient2.id}"}
-        res = self.client.get(RECIPES_URL, params)
-
-        s1 = RecipeSerializer(r1)
-        s2 = RecipeSerializer(r2)
-        s3 = RecipeSerializer(r3)
-
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+    @parametrize(
+        "relation,model_factory,names",
+        [
+            param("tags", TagFactory, ["Vegan", "Vegetarian"], id="tags"),
+            param(
+                "ingredients",
+                IngredientFactory,
+                ["Feta cheese", "Chicken"],
+                id="ingredients",
+            ),
+        ],
+    )
+    def test_filter_by_related(self, relation, model_factory, names):
+        """Test filtering recipes by tags/ingredients."""
+        r1, r2, r3 = RecipeFactory.create_batch(3, user=self.user)
+        obj1 = model_factory(user=self.user, name=names[0])
+        obj2 = model_factory(user=self.user, name=names[1])
+
+        getattr(r1, relation).add(obj1)
+        getattr(r2, relation).add(obj2)
+
+        params = {relation: f"{obj1.id},{obj2.id}"}
+        with self.assertNumQueries(3):
+            res = self.list_recipes(params)
+
+        ids = [r["id"] for r in res.data]
+        self.assertCountEqual(ids, [r1.id, r2.id])
+        self.assertNotIn(r3.id, ids)
 
 
 class ImageUploadTests(TestCase):
     """Tests for the image upload API."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Encode the test JPEG once; each test wraps the bytes in a new file.
+        buf = BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, format="JPEG")
+        cls.jpeg_bytes = buf.getvalue()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(email="user@example.com")
+        cls.recipe = RecipeFactory(user=cls.user)
+
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user(email="user@example.com", password="password123")
         self.client.force_authenticate(self.user)
-        self.recipe = create_recipe(user=self.user)
 
     def tearDown(self):
         self.recipe.image.delete()
@@ -536,12 +506,11 @@ class ImageUploadTests(TestCase):
         """Test uploading an image to a recipe."""
 
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as image_file:
-            img = Image.new("RGB", (10, 10))
-            img.save(image_file, format="JPEG")
-            image_file.seek(0)
-            payload = {"image": image_file}
-            res = self.client.post(url, payload, format="multipart")
+        image_file = SimpleUploadedFile(
+            "test.jpg", self.jpeg_bytes, content_type="image/jpeg"
+        )
+        payload = {"image": image_file}
+        res = self.client.post(url, payload, format="multipart")
 
         self.recipe.refresh_from_db()
         self.assertEqual(res.status_code, status.HTTP_200_OK)
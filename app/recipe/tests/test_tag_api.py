@@ -1,6 +1,5 @@
 """Test tag APIs."""
 
-from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 
@@ -10,6 +9,7 @@ from rest_framework.test import APIClient
 from core.models import Tag
 
 from recipe.serializers import TagSerializer
+from recipe.tests.factories import UserFactory
 
 TAGS_URL = reverse("recipe:tag-list")
 
@@ -19,11 +19,6 @@ def detail_url(tag_id):
     return reverse("recipe:tag-detail", args=[tag_id])
 
 
-def create_user(email="user@example.com", password="testpass123"):
-    """Create and return a new user"""
-    return get_user_model().objects.create_user(email=email, password=password)
-
-
 class PublicRecipeAPITests(TestCase):
     """Test unauthenticated API requests."""
 
@@ -42,7 +37,7 @@ class PrivateRecipeAPITests(TestCase):
 
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user()
+        self.user = UserFactory(email="user@example.com")
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
@@ -52,7 +47,7 @@ class PrivateRecipeAPITests(TestCase):
 
         res = self.client.get(TAGS_URL)
 
-        tags = Tag.objects.all().order_by("-name")
+        tags = Tag.objects.order_by("-name")
         serializer = TagSerializer(tags, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -60,7 +55,7 @@ class PrivateRecipeAPITests(TestCase):
 
     def test_recipe_list_limited_to_user(self):
         """Test list of tags is limited to authenticated user."""
-        other_user = create_user(email="otheruser@exmaple.com", password="testpass321")
+        other_user = UserFactory(email="otheruser@exmaple.com")
 
         Tag.objects.create(user=self.user, name="Fruit")
         Tag.objects.create(user=other_user, name="Comfort Food")
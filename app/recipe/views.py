@@ -59,7 +59,12 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredients_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredients_ids)
 
-        return queryset.filter(user=self.request.user).order_by("-id").distinct()
+        return (
+            queryset.filter(user=self.request.user)
+            .order_by("-id")
+            .distinct()
+            .prefetch_related("tags", "ingredients")
+        )
 
     def get_serializer_class(self):
         """Return the serializer class for request."""
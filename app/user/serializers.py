@@ -4,14 +4,14 @@ from django.contrib.auth import get_user_model, authenticate
 from django.utils.translation import gettext as _
 from rest_framework import serializers
 
+User = get_user_model()  # resolve the user model once instead of per request
+
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the user object"""
 
     class Meta:
-        model = (
-            get_user_model()
-        )  # gets the user model and associate it with the serializer
+        model = User  # associate the user model with the serializer
         fields = [
             "email",
             "password",
@@ -24,17 +24,16 @@ class UserSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """Create and return a user with encrypted password."""
 
-        return get_user_model().objects.create_user(**validated_data)
+        return User.objects.create_user(**validated_data)
 
     def update(self,instance, validated_data):
         """Update and return user"""
         password = validated_data.pop('password', None)
-        user = super().update(instance, validated_data)
         if password:
-            user.set_password(password)
-            user.save()
+            # set before super().update() so its save() writes the hash too
+            instance.set_password(password)
 
-        return user
+        return super().update(instance, validated_data)
 
 
 class AuthTokenSerializer(serializers.Serializer):
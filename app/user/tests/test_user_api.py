@@ -1,43 +1,73 @@
 """Tests for the user API"""
 
+from types import MappingProxyType
+
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
+
+from unittest_parametrize import ParametrizedTestCase, parametrize, param
+
+from user.views import CreateUserView, CreateTokenView, ManageUserView
 
 
 CREATE_USER_URL = reverse("user:register")
 LOGIN_URL = reverse("user:login")
 ME_URL = reverse("user:me")
 
+User = get_user_model()
+
+# Details of the user most tests register or log in as. Read-only so a test
+# cannot leak changes into the others; copy it with {**USER_PAYLOAD, ...}.
+USER_PAYLOAD = MappingProxyType(
+    {
+        "email": "test@example.com",
+        "password": "testpass123",
+        "name": "Test Name",
+    }
+)
+
+# Views called directly from APIRequestFactory requests, which skips URL
+# routing and the middleware stack. Routing and auth of each URL is still
+# covered by at least one APIClient test below.
+CREATE_USER_VIEW = CreateUserView.as_view()
+LOGIN_VIEW = CreateTokenView.as_view()
+ME_VIEW = ManageUserView.as_view()
+
 
 def create_user(**params):
     """Create and return a new user"""
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
 class PublicUserApiTests(TestCase):
     """Test the public features of the user api."""
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient  # Django builds self.client from this per test
+    factory = APIRequestFactory()
+
+    def create_user_request(self, payload):
+        """Call the register view directly with payload."""
+        request = self.factory.post(CREATE_USER_URL, payload)
+        return CREATE_USER_VIEW(request)
 
     def test_create_user_success(self):
         """Test creating a user is successful"""
 
-        payload = {
-            "email": "test@example.com",
-            "password": "testpass123",
-            "name": "Test Name",
-        }  # test payload
+        payload = USER_PAYLOAD  # test payload
         res = self.client.post(CREATE_USER_URL, payload)  # call api
         self.assertEqual(
             res.status_code, status.HTTP_201_CREATED
         )  # check if res status = 201 (successful)
 
-        user = get_user_model().objects.get(
+        user = User.objects.get(
             email=payload["email"]
         )  # check if user is add to the database
         self.assertTrue(
@@ -48,114 +78,117 @@ class PublicUserApiTests(TestCase):
     def test_user_with_email_exists_error(self):
         """Test error returned if user with same email exists"""
 
-        payload = {
-            "email": "test@example.com",
-            "password": "testpass123",
-            "name": "Test Name",
-        }
-        create_user(**payload)
-        res = self.client.post(CREATE_USER_URL, payload)
+        create_user(**USER_PAYLOAD)
+        res = self.create_user_request(USER_PAYLOAD)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_password_too_short_error(self):
         """Test an error is returned if password less than 5 chars."""
 
-        payload = {
-            "email": "test@example.com",
-            "password": "pw",
-            "name": "Test Name",
-        }
+        payload = {**USER_PAYLOAD, "password": "pw"}
 
-        res = self.client.post(CREATE_USER_URL, payload)
+        res = self.create_user_request(payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exists = get_user_model().objects.filter(email=payload["email"]).exists()
+        user_exists = User.objects.filter(email=payload["email"]).exists()
         self.assertFalse(user_exists)
 
+    def test_retrieve_user_unauthorized(self):
+        """Test authentication is required for users."""
+
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserLoginApiTests(ParametrizedTestCase, TestCase):
+    """Test the login (token) endpoint against one shared user."""
+
+    client_class = APIClient
+    factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        create_user(**USER_PAYLOAD)  # created once for the whole class
+
     def test_login_user(self):
         """Test generates token when logged in"""
 
-        user = {
-            "name": "Test Name",
-            "email": "test@example.com",
-            "password": "testpass123",
+        payload = {
+            "email": USER_PAYLOAD["email"],
+            "password": USER_PAYLOAD["password"],
         }
-        create_user(**user)
-
-        payload = {"email": user["email"], "password": user["password"]}
         res = self.client.post(LOGIN_URL, payload)
 
         self.assertIn("token", res.data)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
-    def test_login_bad_credentials(self):
+    @parametrize(
+        "payload",
+        [
+            param(
+                {
+                    "email": "wrong@example.com",
+                    "password": USER_PAYLOAD["password"],
+                },
+                id="bad_email",
+            ),
+            param(
+                {"email": USER_PAYLOAD["email"], "password": "wrongpass123"},
+                id="bad_password",
+            ),
+            param(
+                {"email": USER_PAYLOAD["email"], "password": ""},
+                id="empty_password",
+            ),
+        ],
+    )
+    def test_login_bad_credentials(self, payload):
         """Test return error if credentials invalid"""
-        user = {
-            "name": "Test Name",
-            "email": "test@example.com",
-            "password": "correctpass123",
-        }
-        create_user(**user)
-
-        test_cases = [
-            {
-                "payload": {"email": "wrong@example.com", "password": "correctpass123"},
-                "message": "Invalid email",
-            },
-            {
-                "payload": {"email": "test@example.com", "password": "wrongpass123"},
-                "message": "Invalid password",
-            },
-            {
-                "payload": {"email": "test@example.com", "password": ""},
-                "message": "Password Must Not Be Empty",
-            },
-        ]
-
-        for test_case in test_cases:
-            with self.subTest(msg=test_case["message"]):
-                res = self.client.post(LOGIN_URL, test_case["payload"])
-
-                self.assertNotIn("token", res.data)
-                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
-    def test_retrieve_user_unauthorized(self):
-        """Test authentication is required for users."""
-
-        res = self.client.get(ME_URL)
+        res = LOGIN_VIEW(self.factory.post(LOGIN_URL, payload))
 
-        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertNotIn("token", res.data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
 
 class PrivateUserApiTests(TestCase):
     """Test API requests the require authentication"""
 
-    def setUp(self):
-        self.user = create_user(
+    factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="test@example.com", password="testpass123", name="Test User"
-        )
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.user)
+        )  # created once; each test gets its own copy and a rolled-back DB
+
+    def me_request(self, method, payload=None):
+        """Call the me view directly as the authenticated user."""
+        request = getattr(self.factory, method)(ME_URL, payload)
+        force_authenticate(request, user=self.user)
+        return ME_VIEW(request)
 
     def test_retrieve_profile_success(self):
         """Test retrieving profile for logged in user."""
 
-        res = self.client.get(ME_URL)
+        res = self.me_request("get")
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, {"email": self.user.email, "name": self.user.name})
 
     def test_post_me_not_allowed(self):
         """Test POST is not allowed for me endpoint"""
 
-        res = self.client.post(ME_URL, {})
+        res = self.me_request("post", {})
         self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
     def test_update_user_profile(self):
         """Test updating user profile"""
 
         payload = {"name": "UpdatedName", "password": "newpassword123"}
-        res = self.client.patch(ME_URL, payload)
+        with self.assertNumQueries(1):  # name and password in one UPDATE
+            res = self.me_request("patch", payload)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.user.refresh_from_db()
 